@@ -1,6 +1,6 @@
 import logging
 from copy import deepcopy
-from typing import Optional
+from typing import Iterable, Optional
 
 from thenewboston_node.business_logic.models.account_state import AccountState
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
@@ -28,12 +28,15 @@ class AccountStateMixin:
         for new_account in new_accounts:
             yield new_account
 
-    def get_account_state_attribute_value(self, account: hexstr, attribute: str, on_block_number: int):
+    def _validate_on_block_number(self, on_block_number: int):
         if on_block_number < -1:
             raise ValueError('block_number must be greater or equal to -1')
         elif on_block_number > self.get_current_block_number():  # type: ignore
             raise ValueError('block_number must be less than current block number')
 
+    def get_account_state_attribute_value(self, account: hexstr, attribute: str, on_block_number: int):
+        self._validate_on_block_number(on_block_number)
+
         account_state = self._get_account_state_from_block(account, on_block_number, attribute)
         if account_state:
             return account_state.get_attribute_value(attribute, account)
@@ -46,6 +49,33 @@ class AccountStateMixin:
     def get_account_balance(self, account: hexstr, on_block_number: int) -> int:
         return self.get_account_state_attribute_value(account, 'balance', on_block_number)
 
+    def get_account_balances(self, accounts: Iterable[hexstr], on_block_number: int) -> dict[hexstr, int]:
+        """
+        Return balances of `accounts` on `on_block_number` traversing blocks only once (unlike
+        calling `get_account_balance()` for each account).
+        """
+        self._validate_on_block_number(on_block_number)
+
+        balances = {}
+        accounts_left = set(accounts)
+        if accounts_left:
+            for block in self.yield_blocks_till_snapshot(on_block_number):  # type: ignore
+                for account, account_state in block.message.updated_account_states.items():
+                    if account in accounts_left and account_state.balance is not None:
+                        balances[account] = account_state.balance
+                        accounts_left.remove(account)
+
+                if not accounts_left:
+                    break
+
+        if accounts_left:
+            blockchain_state = self.get_closest_blockchain_state_snapshot(on_block_number + 1)
+            assert blockchain_state
+            for account in accounts_left:
+                balances[account] = blockchain_state.get_account_balance(account)
+
+        return balances
+
     def get_account_current_balance(self, account: str) -> int:
         return self.get_account_balance(account, self.get_current_block_number())  # type: ignore
 
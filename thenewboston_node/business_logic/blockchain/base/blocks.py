@@ -42,6 +42,23 @@ class BlocksMixin:
         warnings.warn('Using low performance implementation of yield_blocks_reversed() method (override it)')
         yield from always_reversible(self.yield_blocks())
 
+    def yield_blocks_slice(self, start: int, stop: Optional[int] = None) -> Generator[Block, None, None]:
+        """
+        Return generator of blocks traversing from `start` to `stop` (exclusive) offsets counted from the first block
+        (till the last block if `stop` is not specified)
+        """
+        # Recommended to override this method in the particular implementation of the blockchain for
+        # performance reasons
+        yield from islice(self.yield_blocks(), start, stop)
+
+    def yield_blocks_slice_reversed(self, start: int, stop: int) -> Generator[Block, None, None]:
+        """
+        Return generator of blocks traversing from `start` to `stop` (exclusive) offsets counted from the head block
+        """
+        # Recommended to override this method in the particular implementation of the blockchain for
+        # performance reasons
+        yield from islice(self.yield_blocks_reversed(), start, stop)
+
     def get_block_by_number(self, block_number: int) -> Optional[Block]:
         # Highly recommended to override this method in the particular implementation of the blockchain for
         # performance reasons
@@ -161,9 +178,8 @@ class BlocksMixin:
         logger.debug(
             'Returning blocks head offset from %s to %s (%s block(s) to return)', -start, -stop, blocks_to_return
         )
-        # TODO(dmu) HIGH: Consider performance optimizations for islice(self.yield_blocks_reversed(), start, stop, 1)
         block = None
-        for block in islice(self.yield_blocks_reversed(), start, stop, 1):  # type: ignore
+        for block in self.yield_blocks_slice_reversed(start, stop):
             block_number = block.message.block_number
             assert account_root_file_block_number is None or account_root_file_block_number < block_number
             logger.debug('Returning block number: %s', block_number)
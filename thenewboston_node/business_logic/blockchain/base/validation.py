@@ -1,5 +1,5 @@
 import logging
-from itertools import chain, islice
+from itertools import chain
 from typing import Iterable, Optional, cast
 
 from thenewboston_node.business_logic.exceptions import ValidationError
@@ -129,13 +129,11 @@ class ValidationMixin:
         """
         assert offset >= 0
 
-        blocks_iter = cast(Iterable[Block], self.yield_blocks())  # type: ignore
-        if offset > 0 or limit is not None:
-            # TODO(dmu) HIGH: Consider performance improvements when slicing
-            if limit is None:
-                blocks_iter = islice(blocks_iter, offset)
-            else:
-                blocks_iter = islice(blocks_iter, offset, offset + limit)
+        if offset == 0 and limit is None:
+            blocks_iter = cast(Iterable[Block], self.yield_blocks())  # type: ignore
+        else:
+            stop = None if limit is None else offset + limit
+            blocks_iter = cast(Iterable[Block], self.yield_blocks_slice(offset, stop))  # type: ignore
 
         try:
             first_block = next(blocks_iter)  # type: ignore
@@ -168,8 +166,11 @@ class ValidationMixin:
             expected_block_identifier = prev_block.message_hash
 
         expected_block_number = first_account_root_file.get_next_block_number() + offset
+        # Account balances are tracked along with block traversal, so balances of accounts met in previous
+        # blocks are not looked up from the blockchain again during block validation
+        account_balances: dict[str, int] = {}
         for block in chain((first_block,), blocks_iter):
-            block.validate(self)
+            block.validate(self, account_balances=account_balances)
 
             assert block.message
 
@@ -181,6 +182,11 @@ class ValidationMixin:
             expected_block_number += 1
             expected_block_identifier = block.message_hash
 
+            for account_number, account_state in block.message.updated_account_states.items():
+                balance = account_state.balance
+                if balance is not None:
+                    account_balances[account_number] = balance
+
     @validates(
         'block number {block.message.block_number} (identifier: block.message.block_identifier) '
         'on blockchain level'
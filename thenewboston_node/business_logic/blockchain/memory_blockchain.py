@@ -1,9 +1,16 @@
 import copy
 import logging
-from typing import Generator, Optional
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Generator, Iterable, Optional
 
+from cachetools import LRUCache
+
+from thenewboston_node.business_logic.models.account_state import AccountState
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
+from thenewboston_node.core.logging import timeit_method
+from thenewboston_node.core.utils.types import hexstr
 
 from .base import BlockchainBase
 
@@ -21,15 +28,45 @@ class MemoryBlockchain(BlockchainBase):
         account_root_files: list[BlockchainState] = None,
         blocks: Optional[list[Block]] = None,
         drop_intermediate_account_root_files=True,
+        account_balances_cache_size=4096,
         **kwargs,
     ):
         super().__init__(**kwargs)
+        # Balances at block numbers up to the head block do not change when new blocks are added, therefore
+        # the cache is only cleared when blocks are replaced or pruned
+        self.account_balances_cache: LRUCache[tuple[hexstr, int], int] = LRUCache(account_balances_cache_size)
         self.blockchain_states: list[BlockchainState] = (
             copy.deepcopy(account_root_files) if account_root_files else []
         )
-        self.blocks: list[Block] = copy.deepcopy(blocks) if blocks else []
+        self.blocks = [block.clone() for block in blocks] if blocks else []
         self.drop_intermediate_account_root_files = drop_intermediate_account_root_files
 
+    @property
+    def blocks(self) -> list[Block]:
+        """
+        Blocks ordered by block number. The list must not be modified in place: use `add_block()` or
+        assign a new list, otherwise block number indexes get out of sync with the blocks.
+        """
+        return self._blocks
+
+    @blocks.setter
+    def blocks(self, blocks: list[Block]):
+        self._blocks = blocks
+        self._first_block_number: Optional[int] = blocks[0].message.block_number if blocks else None
+
+        # Block numbers where an account state was updated: {"account_number": [block_number, ...], ...}
+        self._account_block_numbers: defaultdict[hexstr, list[int]] = defaultdict(list)
+        for block in blocks:
+            self._index_block(block)
+
+        self.account_balances_cache.clear()
+
+    def _index_block(self, block: Block):
+        block_number = block.message.block_number
+        account_block_numbers = self._account_block_numbers
+        for account in block.message.updated_account_states:
+            account_block_numbers[account].append(block_number)
+
     # Account root files related implemented methods
     def persist_blockchain_state(self, account_root_file: BlockchainState):
         self.blockchain_states.append(account_root_file)
@@ -51,26 +88,60 @@ class MemoryBlockchain(BlockchainBase):
 
     # Blocks related implemented methods
     def persist_block(self, block: Block):
-        self.blocks.append(copy.deepcopy(block))
+        block = block.clone()
+        self.blocks.append(block)
+        if self._first_block_number is None:
+            self._first_block_number = block.message.block_number
+
+        self._index_block(block)
+
+    def prune_blocks_before(self, block_number: int):
+        """
+        Remove blocks with block number less than `block_number` to keep memory footprint bounded.
+        There must be a blockchain state snapshot that includes exactly the blocks being removed. Earlier
+        blockchain states are removed as well, so the blockchain becomes a partial blockchain starting
+        from that snapshot and account states can no longer be requested for removed block numbers.
+        """
+        blockchain_states = self.blockchain_states
+        for blockchain_state_index, blockchain_state in enumerate(blockchain_states):
+            if blockchain_state.get_next_block_number() == block_number:
+                break
+        else:
+            raise ValueError(f'Blockchain state with last block number {block_number - 1} is not found')
+
+        self.blockchain_states = blockchain_states[blockchain_state_index:]
+
+        first_block_number = self._first_block_number
+        if first_block_number is not None and block_number > first_block_number:
+            blocks = self.blocks
+            del blocks[:block_number - first_block_number]
+            self._first_block_number = block_number if blocks else None
+
+            account_block_numbers = self._account_block_numbers
+            for account, block_numbers in list(account_block_numbers.items()):
+                index = bisect_left(block_numbers, block_number)
+                if index == len(block_numbers):
+                    del account_block_numbers[account]
+                elif index > 0:
+                    del block_numbers[:index]
+
+        self.account_balances_cache.clear()
 
     def get_block_by_number(self, block_number: int) -> Optional[Block]:
         if block_number < 0:
             raise ValueError('block_number must be greater or equal to 0')
 
-        blocks = self.blocks
-        if not blocks:
+        first_block_number = self._first_block_number
+        if first_block_number is None or block_number < first_block_number:
+            # No blocks or partial blockchain that misses earlier blocks
             return None
 
-        head_block_number = blocks[-1].message.block_number
-        if block_number > head_block_number:
+        blocks = self.blocks
+        block_index = block_number - first_block_number
+        if block_index >= len(blocks):
             return None
 
-        block_index = block_number - head_block_number - 1
-        try:
-            return blocks[block_index]
-        except IndexError:
-            assert blocks[0].message.block_number > block_number
-            return None
+        return blocks[block_index]
 
     def get_block_count(self) -> int:
         return len(self.blocks)
@@ -81,18 +152,99 @@ class MemoryBlockchain(BlockchainBase):
     def yield_blocks_reversed(self) -> Generator[Block, None, None]:
         yield from reversed(self.blocks)
 
+    def yield_blocks_slice(self, start: int, stop: Optional[int] = None) -> Generator[Block, None, None]:
+        yield from self.blocks[start:stop]
+
+    def yield_blocks_slice_reversed(self, start: int, stop: int) -> Generator[Block, None, None]:
+        blocks = self.blocks
+        last_index = len(blocks) - 1
+        for index in range(last_index - start, max(last_index - stop, -1), -1):
+            yield blocks[index]
+
     def yield_blocks_from(self, block_number: int) -> Generator[Block, None, None]:
         # TODO(dmu) MEDIUM: This is questionable if this implementation is faster than base implementation
         #                   (because of extra memory use)
-        blocks = self.blocks
-        if blocks:
-            first_block_number = blocks[0].message.block_number
-            if first_block_number > block_number:
-                logger.warning('Missing blocks from %s to %s', block_number, first_block_number - 1)
-                start = 0
-            else:
-                start = block_number - first_block_number
-        else:
+        first_block_number = self._first_block_number
+        if first_block_number is None:
+            start = 0
+        elif first_block_number > block_number:
+            logger.warning('Missing blocks from %s to %s', block_number, first_block_number - 1)
             start = 0
+        else:
+            start = block_number - first_block_number
 
         yield from self.blocks[start:]
+
+    # Account state related implemented methods
+    def _validate_on_block_number(self, on_block_number: int):
+        super()._validate_on_block_number(on_block_number)
+
+        blockchain_states = self.blockchain_states
+        if blockchain_states:
+            first_blockchain_state = blockchain_states[0]
+            if not first_blockchain_state.is_initial():
+                # Partial blockchain (for instance, after pruning blocks)
+                last_block_number = first_blockchain_state.last_block_number
+                assert last_block_number is not None
+                if on_block_number < last_block_number:
+                    raise ValueError(
+                        'block_number must be greater or equal to first blockchain state last block number '
+                        f'({last_block_number})'
+                    )
+
+    def get_account_balance(self, account: hexstr, on_block_number: int) -> int:
+        cache = self.account_balances_cache
+        key = (account, on_block_number)
+        balance = cache.get(key)
+        if balance is None:
+            balance = super().get_account_balance(account, on_block_number)
+            cache[key] = balance
+
+        return balance
+
+    def get_account_balances(self, accounts: Iterable[hexstr], on_block_number: int) -> dict[hexstr, int]:
+        """
+        Return balances of `accounts` on `on_block_number` by calling `get_account_balance()` for each account.
+        Unlike the base implementation, blocks are not traversed in a single pass: lookups use the per account
+        block numbers index and the account balances cache instead.
+        """
+        return {account: self.get_account_balance(account, on_block_number) for account in accounts}
+
+    @timeit_method()
+    def _get_account_state_from_block(
+        self,
+        account: hexstr,
+        block_number: int,
+        expected_attribute: str,
+    ) -> Optional[AccountState]:
+        if block_number < 0:
+            return None
+
+        account_block_numbers = self._account_block_numbers.get(account)
+        if not account_block_numbers:
+            return None
+
+        # Closest account root file is looked up directly (not with `get_closest_blockchain_state_snapshot()`)
+        # to avoid making its deep copy
+        for account_root_file in reversed(self.blockchain_states):
+            last_block_number = account_root_file.last_block_number
+            if last_block_number is None or last_block_number <= block_number:
+                first_block_number = account_root_file.get_next_block_number()
+                break
+        else:
+            logger.warning('Could not find account root file excluding block number: %s', block_number)
+            return None
+
+        for index in range(bisect_right(account_block_numbers, block_number) - 1, -1, -1):
+            account_block_number = account_block_numbers[index]
+            if account_block_number < first_block_number:
+                break
+
+            block = self.get_block_by_number(account_block_number)
+            assert block
+            account_state = block.message.get_account_state(account)
+            assert account_state
+            if getattr(account_state, expected_attribute, None) is not None:
+                return account_state
+
+        return None
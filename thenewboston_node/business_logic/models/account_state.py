@@ -2,8 +2,10 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
+from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.validators import validate_min_value, validate_not_empty, validate_type
 from thenewboston_node.core.logging import validates
+from thenewboston_node.core.utils.dataclass import add_slots
 from thenewboston_node.core.utils.types import hexstr
 
 from .base import BaseDataclass
@@ -12,6 +14,9 @@ from .node import Node
 logger = logging.getLogger(__name__)
 
 
+# Account states are the most numerous objects, so we use slots to reduce memory footprint and
+# implement (de)serialization and validation explicitly (instead of fields reflection) for performance reasons
+@add_slots
 @dataclass
 class AccountState(BaseDataclass):
     """Account state"""
@@ -28,17 +33,45 @@ class AccountState(BaseDataclass):
     @classmethod
     def deserialize_from_dict(cls, dict_, complain_excessive_keys=True, override=None):
         override = override or {}
-        node_override = override.pop('node', None)
-        if 'node' in dict_ and node_override:
-            dict_ = dict_.copy()
-            node_dict = dict_.pop('node')
-            node_obj = Node.deserialize_from_dict(
-                node_dict, complain_excessive_keys=complain_excessive_keys, override=node_override
+        if complain_excessive_keys:
+            for key in dict_:
+                if key not in ACCOUNT_STATE_FIELD_NAMES:
+                    raise ValidationError(f'Unknown key: {key}')
+
+        node = dict_.get('node')
+        if node is not None:
+            # `node` override is a dict of overrides for `Node` fields (not a `Node` object)
+            node = Node.deserialize_from_dict(
+                node, complain_excessive_keys=complain_excessive_keys, override=override.get('node')
             )
-            override = override or {}
-            override['node'] = node_obj
 
-        return super().deserialize_from_dict(dict_, complain_excessive_keys=complain_excessive_keys, override=override)
+        return cls(
+            balance=override.get('balance', dict_.get('balance')),
+            balance_lock=override.get('balance_lock', dict_.get('balance_lock')),
+            node=node,
+        )
+
+    def serialize_to_dict(self, skip_none_values=True, coerce_to_json_types=True, exclude=()):
+        serialized = {}
+
+        balance = self.balance
+        if 'balance' not in exclude and (balance is not None or not skip_none_values):
+            serialized['balance'] = balance
+
+        balance_lock = self.balance_lock
+        if 'balance_lock' not in exclude and (balance_lock is not None or not skip_none_values):
+            serialized['balance_lock'] = balance_lock
+
+        node = self.node
+        if 'node' not in exclude:
+            if node is not None:
+                serialized['node'] = node.serialize_to_dict(
+                    skip_none_values=skip_none_values, coerce_to_json_types=coerce_to_json_types
+                )
+            elif not skip_none_values:
+                serialized['node'] = None
+
+        return serialized
 
     def get_attribute_value(self, attribute: str, account: str):
         value = getattr(self, attribute)
@@ -53,10 +86,14 @@ class AccountState(BaseDataclass):
 
     @validates()
     def validate(self):
-        for name in self.__dataclass_fields__.keys():
-            value = getattr(self, name)
-            if value is not None:
-                getattr(self, f'validate_{name}')()
+        if self.balance is not None:
+            self.validate_balance()
+
+        if self.balance_lock is not None:
+            self.validate_balance_lock()
+
+        if self.node is not None:
+            self.validate_node()
 
     @validates()
     def validate_balance(self):
@@ -73,4 +110,6 @@ class AccountState(BaseDataclass):
         return
 
 
+ACCOUNT_STATE_FIELD_NAMES = frozenset(AccountState.get_field_names())
+
 # TODO(dmu) CRITICAL: Assert all attributes are optional
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum, unique
+from functools import cache
 
+from .mixins.cloneable import CloneableMixin
 from .mixins.compactable import CompactableMixin
 from .mixins.documentable import DocumentableMixin
 from .mixins.misc import HumanizedClassNameMixin
@@ -12,6 +14,7 @@ class BlockType(Enum):
     NODE_DECLARATION = 'nd'
 
 
+@cache
 def get_request_to_block_type_map():
     from thenewboston_node.business_logic.algorithms.updated_account_states import (
         get_updated_account_states_for_coin_transfer, get_updated_account_states_for_node_declaration
@@ -25,6 +28,11 @@ def get_request_to_block_type_map():
     }
 
 
+@cache
+def get_block_type_to_request_map():
+    return {block_type: class_ for class_, (block_type, _) in get_request_to_block_type_map().items()}
+
+
 @dataclass
-class BaseDataclass(CompactableMixin, HumanizedClassNameMixin, DocumentableMixin):
-    pass
+class BaseDataclass(CloneableMixin, CompactableMixin, HumanizedClassNameMixin, DocumentableMixin):
+    __slots__ = ()
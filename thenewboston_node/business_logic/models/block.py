@@ -11,7 +11,7 @@ from thenewboston_node.core.logging import timeit_method, validates
 from thenewboston_node.core.utils.cryptography import derive_verify_key
 from thenewboston_node.core.utils.types import hexstr
 
-from .base import BaseDataclass, get_request_to_block_type_map
+from .base import BaseDataclass, get_block_type_to_request_map
 from .block_message import BlockMessage
 from .mixins.compactable import MessagpackCompactableMixin
 from .mixins.signable import SignableMixin
@@ -43,21 +43,18 @@ class Block(SignableMixin, MessagpackCompactableMixin, BaseDataclass):
             raise ValidationError('message must be a dict')
 
         instance_block_type = message_dict.get('block_type')
-        for signed_change_request_class, (block_type, _) in get_request_to_block_type_map().items():
-            if block_type == instance_block_type:
-                signed_change_request_dict = message_dict.get('signed_change_request')
-                if signed_change_request_dict is None:
-                    raise ValidationError('Missing keys: signed_change_request')
-                elif not isinstance(signed_change_request_dict, dict):
-                    raise ValidationError('signed_change_request must be a dict')
-
-                signed_change_request_obj = signed_change_request_class.deserialize_from_dict(
-                    signed_change_request_dict
-                )
-                break
-        else:
+        signed_change_request_class = get_block_type_to_request_map().get(instance_block_type)
+        if signed_change_request_class is None:
             raise NotImplementedError(f'message.block_type "{instance_block_type}" is not supported')
 
+        signed_change_request_dict = message_dict.get('signed_change_request')
+        if signed_change_request_dict is None:
+            raise ValidationError('Missing keys: signed_change_request')
+        elif not isinstance(signed_change_request_dict, dict):
+            raise ValidationError('signed_change_request must be a dict')
+
+        signed_change_request_obj = signed_change_request_class.deserialize_from_dict(signed_change_request_dict)
+
         message_obj = BlockMessage.deserialize_from_dict(
             message_dict, override={'signed_change_request': signed_change_request_obj}
         )
@@ -116,19 +113,19 @@ class Block(SignableMixin, MessagpackCompactableMixin, BaseDataclass):
         self.message_hash = message_hash
 
     @validates('block')
-    def validate(self, blockchain):
+    def validate(self, blockchain, account_balances: Optional[dict[hexstr, int]] = None):
         with validates(f'block number {self.message.block_number} (identifier: {self.message.block_identifier})'):
-            self.validate_message(blockchain)
+            self.validate_message(blockchain, account_balances=account_balances)
             self.validate_message_hash()
             with validates('block signature'):
                 self.validate_signature()
 
     @validates('block message on block level')
-    def validate_message(self, blockchain):
+    def validate_message(self, blockchain, account_balances: Optional[dict[hexstr, int]] = None):
         if not self.message:
             raise ValidationError('Block message must be not empty')
 
-        self.message.validate(blockchain)
+        self.message.validate(blockchain, account_balances=account_balances)
 
     @validates('block message hash')
     def validate_message_hash(self):
@@ -1,4 +1,3 @@
-import copy
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -10,12 +9,13 @@ from thenewboston_node.business_logic.validators import (
     validate_type
 )
 from thenewboston_node.core.logging import validates
+from thenewboston_node.core.utils.constants import SENTINEL
 from thenewboston_node.core.utils.types import hexstr
 
 from . import AccountState
 from .base import BaseDataclass, get_request_to_block_type_map  # noqa: I101
 from .mixins.message import MessageMixin
-from .signed_change_request import SignedChangeRequest
+from .signed_change_request import CoinTransferSignedChangeRequest, SignedChangeRequest
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +47,15 @@ class BlockMessage(MessageMixin, BaseDataclass):
     @classmethod
     def deserialize_from_dict(cls, dict_, complain_excessive_keys=True, override=None):
         override = override or {}
-        if 'updated_account_states' in dict_ and 'updated_account_states' not in override:
-            logger.debug(
-                'updated_account_states = %s is not overridden (will override)', dict['updated_account_states']
-            )
-            dict_ = dict_.copy()
-            updated_account_states_dict = dict_.pop('updated_account_states')
+        updated_account_states_dict = dict_.get('updated_account_states', SENTINEL)
+        if updated_account_states_dict is not SENTINEL and 'updated_account_states' not in override:
+            is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if is_debug_enabled:
+                logger.debug(
+                    'updated_account_states = %s is not overridden (will override)', updated_account_states_dict
+                )
+
+            # `dict_` is not copied: overridden keys are skipped by generic deserialization
             item_values_override = {
                 key: {
                     'node': {
@@ -60,7 +63,8 @@ class BlockMessage(MessageMixin, BaseDataclass):
                     }
                 } for key, value in updated_account_states_dict.items()
             }
-            logger.debug('item_values_override = %s', item_values_override)
+            if is_debug_enabled:
+                logger.debug('item_values_override = %s', item_values_override)
 
             updated_account_states_obj = cls.deserialize_from_inner_dict(
                 cls.get_field_type('updated_account_states'),
@@ -69,8 +73,10 @@ class BlockMessage(MessageMixin, BaseDataclass):
                 item_values_override=item_values_override
             )
 
-            logger.debug('updated_account_states_obj = %s', updated_account_states_obj)
-            override['updated_account_states'] = updated_account_states_obj
+            if is_debug_enabled:
+                logger.debug('updated_account_states_obj = %s', updated_account_states_obj)
+
+            override = {**override, 'updated_account_states': updated_account_states_obj}
 
         return super().deserialize_from_dict(dict_, complain_excessive_keys=complain_excessive_keys, override=override)
 
@@ -79,15 +85,22 @@ class BlockMessage(MessageMixin, BaseDataclass):
         if not signed_change_request.signer:
             raise ValueError('Sender must be set')
 
-        for class_, (block_type, get_updated_account_states) in get_request_to_block_type_map().items():  # noqa: B007
-            if isinstance(signed_change_request, class_):
-                updated_account_states = get_updated_account_states(signed_change_request, blockchain)
-                break
-        else:
-            raise NotImplementedError(f'signed_change_request type {type(signed_change_request)} is not supported')
+        request_to_block_type_map = get_request_to_block_type_map()
+        block_type_entry = request_to_block_type_map.get(type(signed_change_request))
+        if block_type_entry is None:
+            # Fallback for subclasses of supported signed change requests
+            for class_, class_block_type_entry in request_to_block_type_map.items():
+                if isinstance(signed_change_request, class_):
+                    block_type_entry = class_block_type_entry
+                    break
+            else:
+                raise NotImplementedError(f'signed_change_request type {type(signed_change_request)} is not supported')
 
+        block_type, get_updated_account_states = block_type_entry
         assert block_type
 
+        updated_account_states = get_updated_account_states(signed_change_request, blockchain)
+
         # TODO(dmu) HIGH: Move source of time to Blockchain?
         timestamp = datetime.utcnow()
 
@@ -96,7 +109,7 @@ class BlockMessage(MessageMixin, BaseDataclass):
 
         return BlockMessage(
             block_type=block_type,
-            signed_change_request=copy.deepcopy(signed_change_request),
+            signed_change_request=signed_change_request.clone(),
             timestamp=timestamp,
             block_number=block_number,
             block_identifier=block_identifier,
@@ -104,7 +117,7 @@ class BlockMessage(MessageMixin, BaseDataclass):
         )
 
     def get_account_state(self, account: hexstr) -> Optional[AccountState]:
-        return (self.updated_account_states or {}).get(account)
+        return self.updated_account_states.get(account)
 
     def get_sent_amount(self):
         assert self.signed_change_request
@@ -115,7 +128,11 @@ class BlockMessage(MessageMixin, BaseDataclass):
         return self.signed_change_request.get_recipient_amount(recipient)
 
     @validates('block message')
-    def validate(self, blockchain):
+    def validate(self, blockchain, account_balances: Optional[dict[hexstr, int]] = None):
+        """
+        Validate block message. `account_balances` are optional known account balances on the previous block
+        (to be used instead of looking them up in `blockchain`).
+        """
         self.validate_signed_change_request(blockchain)
         self.validate_block_number()
 
@@ -123,7 +140,7 @@ class BlockMessage(MessageMixin, BaseDataclass):
         self.validate_timestamp(blockchain)
         self.validate_block_identifier(blockchain)
 
-        self.validate_updated_account_states(blockchain)
+        self.validate_updated_account_states(blockchain, account_balances=account_balances)
 
     @validates('transfer request on block message level')
     def validate_signed_change_request(self, blockchain):
@@ -199,23 +216,41 @@ class BlockMessage(MessageMixin, BaseDataclass):
             raise ValidationError('Invalid block identifier')
 
     @validates()
-    def validate_updated_account_states(self, blockchain):
+    def validate_updated_account_states(self, blockchain, account_balances: Optional[dict[hexstr, int]] = None):
         updated_account_states = self.updated_account_states
 
         humanized_class_name = self.humanized_class_name_lowered
         validate_not_empty(f'{humanized_class_name} updated_account_states', updated_account_states)
 
-        from .signed_change_request import CoinTransferSignedChangeRequest
-        if isinstance(self.signed_change_request, CoinTransferSignedChangeRequest):
+        signed_change_request = self.signed_change_request
+        if isinstance(signed_change_request, CoinTransferSignedChangeRequest):
             validate_min_item_count(f'{humanized_class_name} updated_account_states', updated_account_states, 2)
 
-            signer = self.signed_change_request.signer
-            sender_account_state = self.updated_account_states.get(signer)
+            signer = signed_change_request.signer
+            sender_account_state = updated_account_states.get(signer)
             validate_not_empty(f'{humanized_class_name} updated_account_states.{signer}', sender_account_state)
 
+            # Loop invariants are evaluated once for performance reasons
+            account_subject = f'{humanized_class_name} updated_account_states key (account number)'
+            sent_amount = self.get_sent_amount()
+            if account_balances is None:
+                balances = blockchain.get_account_balances(updated_account_states.keys(), self.block_number - 1)
+            else:
+                # Only balances of this block accounts are collected (the rolling `account_balances` may be large)
+                balances = {}
+                unknown_accounts = []
+                for account_number in updated_account_states:
+                    balance = account_balances.get(account_number)
+                    if balance is None:
+                        unknown_accounts.append(account_number)
+                    else:
+                        balances[account_number] = balance
+
+                if unknown_accounts:
+                    balances.update(blockchain.get_account_balances(unknown_accounts, self.block_number - 1))
+
             for account_number, account_state in updated_account_states.items():
                 with validates(f'{humanized_class_name} account {account_number} updated state'):
-                    account_subject = f'{humanized_class_name} updated_account_states key (account number)'
                     validate_not_empty(account_subject, account_number)
                     validate_type(account_subject, account_number, str)
 
@@ -228,7 +263,9 @@ class BlockMessage(MessageMixin, BaseDataclass):
                         account_number=account_number,
                         account_state=account_state,
                         blockchain=blockchain,
-                        is_sender=is_sender
+                        is_sender=is_sender,
+                        sent_amount=sent_amount,
+                        balance=balances[account_number],
                     )
 
     @validates('account {account_number} balance lock')
@@ -248,16 +285,23 @@ class BlockMessage(MessageMixin, BaseDataclass):
             validate_empty(subject, balance_lock)
 
     @validates('account {account_number} balance value')
-    def validate_updated_account_balance(self, *, account_number, account_state, blockchain, is_sender=False):
+    def validate_updated_account_balance(
+        self, *, account_number, account_state, blockchain, is_sender=False, sent_amount=None, balance=None
+    ):
         subject = (
             f'{self.humanized_class_name_lowered} {"sender" if is_sender else "recipient"} account '
             f'{account_number}'
         )
 
-        balance = blockchain.get_account_balance(account_number, self.block_number - 1)
+        if balance is None:
+            balance = blockchain.get_account_balance(account_number, self.block_number - 1)
+
         if is_sender:
             validate_greater_than_zero(f'sender account {account_number} current balance', balance)
-            expected_balance = balance - self.get_sent_amount()
+            if sent_amount is None:
+                sent_amount = self.get_sent_amount()
+
+            expected_balance = balance - sent_amount
         else:
             expected_balance = balance + self.get_recipient_amount(account_number)
 
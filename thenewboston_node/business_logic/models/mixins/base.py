@@ -6,6 +6,7 @@ NONE_TYPE = type(None)
 
 
 class BaseMixin:
+    __slots__ = ()
 
     @classmethod
     def get_field_names(cls):
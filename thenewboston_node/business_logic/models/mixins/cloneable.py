@@ -0,0 +1,28 @@
+from .base import BaseMixin
+
+
+def clone_value(value):
+    if isinstance(value, CloneableMixin):
+        return value.clone()
+    elif isinstance(value, list):
+        return [clone_value(item) for item in value]
+    elif isinstance(value, dict):
+        return {item_key: clone_value(item_value) for item_key, item_value in value.items()}
+
+    # Other values are immutable (str, int, bool, datetime, None) and can be shared
+    return value
+
+
+class CloneableMixin(BaseMixin):
+    __slots__ = ()
+
+    def clone(self):
+        """
+        Return a deep copy of the instance. This is a faster specialized version of `copy.deepcopy()` which
+        skips memo dict and `copy` module dispatch since models are trees of dataclasses, lists and dicts
+        (immutable leaf values are shared).
+        """
+        return self.__class__(**{  # type: ignore
+            field_name: clone_value(getattr(self, field_name))
+            for field_name in self.get_field_names()
+        })
@@ -102,6 +102,7 @@ def compact_key(key):
 
 
 class CompactableMixin(SerializableMixin):
+    __slots__ = ()
 
     @classmethod
     def from_compact_dict(cls, compact_dict, compact_keys=True, compact_values=True):
@@ -17,6 +17,7 @@ def extract_attribute_docs(model):
 
 
 class DocumentableMixin(BaseMixin):
+    __slots__ = ()
 
     @classmethod
     def get_nested_models(cls, known_models=(), include_self=False):
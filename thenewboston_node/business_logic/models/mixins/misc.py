@@ -1,10 +1,19 @@
+from functools import cache
+
 from thenewboston_node.core.utils.misc import humanize_camel_case
 
 
+@cache
+def get_humanized_class_name(class_, apply_upper_first=True):
+    # Class names do not change, so humanized names are computed once per class
+    return humanize_camel_case(class_.__name__, apply_upper_first=apply_upper_first)
+
+
 class HumanizedClassNameMixin:
+    __slots__ = ()
 
     def get_humanized_class_name(self, apply_upper_first=True):
-        return humanize_camel_case(self.__class__.__name__, apply_upper_first=apply_upper_first)
+        return get_humanized_class_name(self.__class__, apply_upper_first=apply_upper_first)
 
     @property
     def humanized_class_name(self):
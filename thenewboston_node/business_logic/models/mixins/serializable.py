@@ -1,3 +1,4 @@
+import sys
 import typing
 
 from thenewboston_node.business_logic.exceptions import ValidationError
@@ -49,6 +50,7 @@ def serialize_value(value, skip_none_values, coerce_to_json_types):  # noqa: C90
 
 
 class SerializableMixin(BaseMixin):
+    __slots__ = ()
 
     @staticmethod
     def deserialize_from_inner_list(field_type, value, complain_excessive_keys):
@@ -78,6 +80,10 @@ class SerializableMixin(BaseMixin):
                 )
             else:
                 item_key = coerce_from_json_type(item_key, item_key_type)
+                if type(item_key) is str:
+                    # String keys are mostly account numbers which are repeatedly used for dict lookups,
+                    # so we intern them to save memory and get faster key comparison
+                    item_key = sys.intern(item_key)
 
             if issubclass(item_value_type, SerializableMixin):
                 item_value = item_value_type.deserialize_from_dict(
@@ -10,8 +10,9 @@ from thenewboston_node.business_logic.models.blockchain_state import BlockchainS
 from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
 from thenewboston_node.core.utils.cryptography import KeyPair, derive_verify_key
 from thenewboston_node.core.utils.factory import Factory, factory
+from thenewboston_node.core.utils.types import hexstr
 
-DEFAULT_ACCOUNT = 'd5356888dc9303e44ce52b1e06c3165a7759b9df1e6a6dfbd33ee1c3df1ab4d1'
+DEFAULT_ACCOUNT = hexstr('d5356888dc9303e44ce52b1e06c3165a7759b9df1e6a6dfbd33ee1c3df1ab4d1')
 
 # TODO(dmu) HIGH: Replace these factories with `baker`-based factories
 
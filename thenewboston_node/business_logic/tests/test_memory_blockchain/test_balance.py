@@ -1,8 +1,14 @@
+from unittest.mock import patch
+
 import pytest
 
+from thenewboston_node.business_logic.blockchain.base import BlockchainBase
 from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
+from thenewboston_node.business_logic.tests.factories import (
+    DEFAULT_ACCOUNT, AccountStateFactory, CoinTransferBlockFactory, CoinTransferBlockMessageFactory
+)
 from thenewboston_node.core.utils.cryptography import KeyPair
 
 
@@ -72,3 +78,112 @@ def test_can_get_account_state_by_block_number(
     assert blockchain.get_account_balance(recipient, 2) == 10 + 11 + 12
     assert blockchain.get_account_current_balance(sender) == sender_initial_balance - 10 - 11 - 12 - 3 * total_fees
     assert blockchain.get_account_current_balance(recipient) == 10 + 11 + 12
+
+
+def test_get_account_balance_from_assigned_blocks(forced_memory_blockchain: MemoryBlockchain):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(  # type: ignore
+            message=CoinTransferBlockMessageFactory(
+                block_number=block_number,
+                block_identifier=str(block_number),
+                updated_account_states={DEFAULT_ACCOUNT: AccountStateFactory(balance=balance)}
+            )
+        ) for block_number, balance in ((0, 100), (1, 200), (2, 300))
+    ]
+
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, -1) == 0
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, 0) == 100
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, 1) == 200
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, 2) == 300
+    assert forced_memory_blockchain.get_account_current_balance(DEFAULT_ACCOUNT) == 300
+
+
+def test_get_account_state_from_block_does_not_copy_blockchain_state(forced_memory_blockchain: MemoryBlockchain):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(  # type: ignore
+            message=CoinTransferBlockMessageFactory(
+                updated_account_states={DEFAULT_ACCOUNT: AccountStateFactory(balance=100)}
+            )
+        )
+    ]
+    with patch.object(forced_memory_blockchain, 'get_closest_blockchain_state_snapshot', side_effect=AssertionError):
+        account_state = forced_memory_blockchain._get_account_state_from_block(DEFAULT_ACCOUNT, 0, 'balance')
+
+    assert account_state
+    assert account_state.balance == 100
+
+
+def test_account_balances_cache_is_cleared_on_blocks_assignment(forced_memory_blockchain: MemoryBlockchain):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(  # type: ignore
+            message=CoinTransferBlockMessageFactory(
+                updated_account_states={DEFAULT_ACCOUNT: AccountStateFactory(balance=100)}
+            )
+        )
+    ]
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, 0) == 100
+    assert forced_memory_blockchain.account_balances_cache[(DEFAULT_ACCOUNT, 0)] == 100
+
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(  # type: ignore
+            message=CoinTransferBlockMessageFactory(
+                updated_account_states={DEFAULT_ACCOUNT: AccountStateFactory(balance=200)}
+            )
+        )
+    ]
+    assert not forced_memory_blockchain.account_balances_cache
+    assert forced_memory_blockchain.get_account_balance(DEFAULT_ACCOUNT, 0) == 200
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_get_account_balances(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair,
+    primary_validator_key_pair: KeyPair, node_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    accounts = (
+        treasury_account_key_pair.public, user_account_key_pair.public, primary_validator_key_pair.public,
+        node_key_pair.public
+    )
+    for amount in (10, 11, 12):
+        block = Block.create_from_main_transaction(
+            blockchain, user_account_key_pair.public, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    for block_number in range(-1, 3):
+        expected_balances = {account: blockchain.get_account_balance(account, block_number) for account in accounts}
+        assert blockchain.get_account_balances(accounts, block_number) == expected_balances
+        # Base class implementation traverses blocks once
+        assert BlockchainBase.get_account_balances(blockchain, accounts, block_number) == expected_balances
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_get_account_balance_after_pruning_blocks(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    recipient = user_account_key_pair.public
+    for amount in (10, 11, 12, 13):
+        block = Block.create_from_main_transaction(
+            blockchain, recipient, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    blockchain.snapshot_blockchain_state()
+    block = Block.create_from_main_transaction(
+        blockchain, recipient, 14, signing_key=treasury_account_key_pair.private
+    )
+    blockchain.add_block(block)
+    assert [blockchain.get_account_balance(recipient, block_number) for block_number in range(-1, 5)
+            ] == [0, 10, 21, 33, 46, 60]
+
+    blockchain.prune_blocks_before(4)
+    assert blockchain.get_block_count() == 1
+    assert blockchain.get_account_balance(recipient, 3) == 46
+    assert blockchain.get_account_balance(recipient, 4) == 60
+    for block_number in range(-1, 3):
+        with pytest.raises(ValueError, match='block_number must be greater or equal to first blockchain state'):
+            blockchain.get_account_balance(recipient, block_number)
+
+    blockchain.validate()
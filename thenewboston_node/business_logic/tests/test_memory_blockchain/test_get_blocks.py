@@ -1,5 +1,7 @@
 import copy
 
+import pytest
+
 from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
 from thenewboston_node.business_logic.tests.factories import CoinTransferBlockFactory, CoinTransferBlockMessageFactory
 
@@ -71,3 +73,88 @@ def test_yield_blocks_till_snapshot(forced_memory_blockchain: MemoryBlockchain,
             ] == [2, 1, 0]
     assert [block.message.block_number for block in forced_memory_blockchain.yield_blocks_till_snapshot(1)] == [1, 0]
     assert [block.message.block_number for block in forced_memory_blockchain.yield_blocks_till_snapshot(0)] == [0]
+
+
+def test_yield_blocks_slice_reversed(forced_memory_blockchain: MemoryBlockchain):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(message=CoinTransferBlockMessageFactory(block_number=x,
+                                                                         block_identifier=str(x)))  # type: ignore
+        for x in range(9)
+    ]
+
+    def get_block_numbers(start, stop):
+        blocks = forced_memory_blockchain.yield_blocks_slice_reversed(start, stop)
+        return [block.message.block_number for block in blocks]
+
+    assert get_block_numbers(0, 9) == [8, 7, 6, 5, 4, 3, 2, 1, 0]
+    assert get_block_numbers(0, 20) == [8, 7, 6, 5, 4, 3, 2, 1, 0]
+    assert get_block_numbers(3, 5) == [5, 4]
+    assert get_block_numbers(8, 9) == [0]
+    assert get_block_numbers(3, 3) == []
+    assert get_block_numbers(9, 12) == []
+
+
+def test_yield_blocks_slice(forced_memory_blockchain: MemoryBlockchain):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(message=CoinTransferBlockMessageFactory(block_number=x,
+                                                                         block_identifier=str(x)))  # type: ignore
+        for x in range(9)
+    ]
+
+    def get_block_numbers(start, stop=None):
+        blocks = forced_memory_blockchain.yield_blocks_slice(start, stop)
+        return [block.message.block_number for block in blocks]
+
+    assert get_block_numbers(0) == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert get_block_numbers(6) == [6, 7, 8]
+    assert get_block_numbers(0, 20) == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert get_block_numbers(3, 5) == [3, 4]
+    assert get_block_numbers(3, 3) == []
+    assert get_block_numbers(9) == []
+
+
+def test_get_block_by_number(forced_memory_blockchain: MemoryBlockchain):
+    assert forced_memory_blockchain.get_block_by_number(0) is None
+
+    # Partial blockchain
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(message=CoinTransferBlockMessageFactory(block_number=x,
+                                                                         block_identifier=str(x)))  # type: ignore
+        for x in range(3, 6)
+    ]
+    assert forced_memory_blockchain.get_block_by_number(0) is None
+    assert forced_memory_blockchain.get_block_by_number(2) is None
+    for block_number in range(3, 6):
+        block = forced_memory_blockchain.get_block_by_number(block_number)
+        assert block
+        assert block.message.block_number == block_number
+    assert forced_memory_blockchain.get_block_by_number(6) is None
+
+
+def test_prune_blocks_before(forced_memory_blockchain: MemoryBlockchain, blockchain_genesis_state):
+    forced_memory_blockchain.blocks = [
+        CoinTransferBlockFactory(message=CoinTransferBlockMessageFactory(block_number=x,
+                                                                         block_identifier=str(x)))  # type: ignore
+        for x in range(9)
+    ]
+
+    with pytest.raises(ValueError, match='Blockchain state with last block number 5 is not found'):
+        forced_memory_blockchain.prune_blocks_before(6)
+
+    account_root_file1 = copy.deepcopy(blockchain_genesis_state)
+    account_root_file1.last_block_number = 5
+    forced_memory_blockchain.blockchain_states.append(account_root_file1)
+
+    forced_memory_blockchain.prune_blocks_before(6)
+    assert forced_memory_blockchain.get_block_count() == 3
+    assert forced_memory_blockchain.get_block_by_number(5) is None
+    block = forced_memory_blockchain.get_block_by_number(6)
+    assert block
+    assert block.message.block_number == 6
+    assert [block.message.block_number for block in forced_memory_blockchain.yield_blocks_till_snapshot()] == [8, 7, 6]
+
+    assert forced_memory_blockchain.blockchain_states == [account_root_file1]
+
+    # Pruning already pruned blocks is no-op
+    forced_memory_blockchain.prune_blocks_before(6)
+    assert forced_memory_blockchain.get_block_count() == 3
@@ -1,6 +1,10 @@
 import pytest
 from tqdm import tqdm
 
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.exceptions import InvalidMessageSignatureError
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.utils.cryptography import KeyPair
 from thenewboston_node.core.utils.pytest import skip_slow
 
 
@@ -28,3 +32,31 @@ def test_can_validate_blockchain_in_chunks_for_file_blockchain(large_blockchain)
     block_count = large_blockchain.get_block_count()
     for offset in tqdm(range(0, block_count, CHUNK_SIZE)):
         large_blockchain.validate_blocks(offset=offset, limit=CHUNK_SIZE)
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_can_validate_blocks_with_offset_and_no_limit(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    for amount in (10, 11, 12, 13):
+        block = Block.create_from_main_transaction(
+            blockchain, user_account_key_pair.public, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    blockchain.validate_blocks()
+    blockchain.validate_blocks(offset=2)
+    blockchain.validate_blocks(offset=4)
+
+    # Invalid block in skipped blocks is not reported
+    blockchain.blocks[0].signature = blockchain.blocks[1].signature
+    with pytest.raises(InvalidMessageSignatureError):
+        blockchain.validate_blocks()
+
+    blockchain.validate_blocks(offset=1)
+
+    # Invalid block after offset is reported
+    blockchain.blocks[3].signature = blockchain.blocks[1].signature
+    with pytest.raises(InvalidMessageSignatureError):
+        blockchain.validate_blocks(offset=2)
@@ -0,0 +1,73 @@
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import AccountState
+from thenewboston_node.business_logic.models.mixins.serializable import SerializableMixin
+from thenewboston_node.business_logic.models.node import Node
+from thenewboston_node.core.utils.types import hexstr
+
+NODE_IDENTIFIER = hexstr('b9dc49411424cce606d27eeaa8d74cb84826d8a1001d17603638b73bdc6077f1')
+
+
+@pytest.mark.parametrize(
+    'account_state', (
+        AccountState(),
+        AccountState(balance=10),
+        AccountState(balance=0, balance_lock=hexstr('fake-balance-lock')),
+        AccountState(node=Node(identifier=NODE_IDENTIFIER, network_addresses=['http://127.0.0.1'], fee_amount=4)),
+    )
+)
+@pytest.mark.parametrize('skip_none_values', (True, False))
+def test_account_state_serialization(account_state, skip_none_values):
+    serialized = account_state.serialize_to_dict(skip_none_values=skip_none_values)
+    assert serialized == SerializableMixin.serialize_to_dict(account_state, skip_none_values=skip_none_values)
+    assert account_state.serialize_to_dict(exclude=('balance',)).get('balance') is None
+
+    serialized = account_state.serialize_to_dict()
+    deserialized = AccountState.deserialize_from_dict(serialized, override={'node': {'identifier': NODE_IDENTIFIER}})
+    assert deserialized == account_state
+
+
+def test_account_state_deserialization_complains_unknown_keys():
+    serialized = {'balance': 10, 'unknown': 1}
+    with pytest.raises(ValidationError, match='Unknown key: unknown'):
+        AccountState.deserialize_from_dict(serialized)
+
+    assert AccountState.deserialize_from_dict(serialized, complain_excessive_keys=False) == AccountState(balance=10)
+
+
+def test_account_state_validation():
+    AccountState().validate()
+    AccountState(balance=10, balance_lock=hexstr('fake-balance-lock')).validate()
+
+    with pytest.raises(ValidationError, match='Account state balance must be greater or equal to 0'):
+        AccountState(balance=-1).validate()
+
+    with pytest.raises(ValidationError, match='Account state balance_lock must be not empty'):
+        AccountState(balance_lock=hexstr('')).validate()
+
+
+def test_account_state_validation_covers_all_fields():
+    account_state = AccountState(
+        balance=10,
+        balance_lock=hexstr('fake-balance-lock'),
+        node=Node(identifier=NODE_IDENTIFIER, network_addresses=['http://127.0.0.1'], fee_amount=4)
+    )
+    # Explicit validation must be updated when fields are added
+    with ExitStack() as stack:
+        mocks = [
+            stack.enter_context(patch.object(AccountState, f'validate_{field_name}'))
+            for field_name in AccountState.get_field_names()
+        ]
+        account_state.validate()
+
+    for mock in mocks:
+        mock.assert_called_once_with()
+
+
+def test_account_state_uses_slots():
+    # All base classes must declare `__slots__` otherwise `__dict__` is added to instances
+    assert not hasattr(AccountState(), '__dict__')
@@ -1,8 +1,10 @@
 import copy
+import sys
 
 import pytest
 
 from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models import BlockMessage
 
 
 def test_validate_updated_account_states(memory_blockchain, block_message):
@@ -104,3 +106,19 @@ def test_validate_updated_account_states(memory_blockchain, block_message):
         ValidationError, match=r'Block message recipient account [0-9a-f]{64} balance must be equal to \d+'
     ):
         block_message_copy.validate_updated_account_states(memory_blockchain)
+
+
+def test_deserialize_interns_account_numbers(block_message):
+    serialized = block_message.serialize_to_dict()
+    serialized['updated_account_states'] = {
+        # Make not interned copies of account numbers
+        ''.join(list(account_number)): account_state
+        for account_number, account_state in serialized['updated_account_states'].items()
+    }
+
+    deserialized = BlockMessage.deserialize_from_dict(
+        serialized, override={'signed_change_request': block_message.signed_change_request}
+    )
+    assert deserialized == block_message
+    for account_number in deserialized.updated_account_states:
+        assert account_number is sys.intern(account_number)
@@ -0,0 +1,15 @@
+def test_block_clone(block_0):
+    block = block_0.clone()
+    assert block == block_0
+    assert block is not block_0
+
+    assert block.message is not block_0.message
+    assert block.message.signed_change_request is not block_0.message.signed_change_request
+    assert block.message.signed_change_request.message.txs is not block_0.message.signed_change_request.message.txs
+    assert block.message.updated_account_states is not block_0.message.updated_account_states
+    for account, account_state in block.message.updated_account_states.items():
+        assert account_state == block_0.message.updated_account_states[account]
+        assert account_state is not block_0.message.updated_account_states[account]
+
+    block.message.updated_account_states.clear()
+    assert block_0.message.updated_account_states
@@ -102,6 +102,9 @@ class validates:
         self.is_plural_target = is_plural_target
         self.use_format_map = use_format_map
 
+    def is_logging_enabled(self):
+        return self.logger.isEnabledFor(self.level)
+
     def log_validation_started(self, target):
         self.logger.log(self.level, 'Validating %s', target)
 
@@ -117,40 +120,51 @@ class validates:
 
     def __enter__(self):  # type: ignore
         self.target_template = self.target_template or 'code block'
-        self.log_validation_started(self.target_template)
+        if self.is_logging_enabled():
+            self.log_validation_started(self.target_template)
         return self
 
     def __exit__(self, *exc_info) -> None:  # type: ignore
         if any(exc_info):
             self.log_validation_failed(self.target_template, exc_info[1])
-        else:
+        elif self.is_logging_enabled():
             self.log_validation_passed(self.target_template)
 
+    def render_target(self, callable_, args, kwargs):
+        target_template = self.target_template
+        if target_template is None:
+            parent_name = humanize_camel_case(args[0].__class__.__name__, apply_upper_first=False)
+            name = callable_.__name__.removeprefix('validate_')
+            name = '' if name == 'validate' else name
+            target_template = f'{parent_name} {name}'.strip()
+
+        if self.use_format_map:
+            return target_template.format_map(Default(**kwargs))
+
+        return target_template.format(*args, **kwargs)
+
     def __call__(self, callable_):
 
         @functools.wraps(callable_)
         def wrapper(*args, **kwargs):
-
-            target_template = self.target_template
-            if target_template is None:
-                parent_name = humanize_camel_case(args[0].__class__.__name__, apply_upper_first=False)
-                name = callable_.__name__.removeprefix('validate_')
-                name = '' if name == 'validate' else name
-                target_template = f'{parent_name} {name}'.strip()
-
-            if self.use_format_map:
-                target = target_template.format_map(Default(**kwargs))
+            # Validations are called very often, so we do not render target unless it is going to be logged
+            # (which is the case for failed validations or enabled logging level)
+            if self.is_logging_enabled():
+                target = self.render_target(callable_, args, kwargs)
+                self.log_validation_started(target)
             else:
-                target = target_template.format(*args, **kwargs)
+                target = None
 
-            self.log_validation_started(target)
             try:
                 rv = callable_(*args, **kwargs)
             except Exception as ex:
+                if target is None:
+                    target = self.render_target(callable_, args, kwargs)
                 self.log_validation_failed(target, ex)
                 raise
             else:
-                self.log_validation_passed(target)
+                if target is not None:
+                    self.log_validation_passed(target)
                 return rv
 
         return wrapper
@@ -0,0 +1,29 @@
+import copy
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from thenewboston_node.core.utils.dataclass import add_slots
+
+
+@add_slots
+@dataclass
+class SlottedDataclass:
+    """Docstring"""
+
+    value: int
+    optional_value: Optional[str] = None
+
+
+def test_add_slots():
+    instance = SlottedDataclass(value=1)
+    assert SlottedDataclass.__slots__ == ('value', 'optional_value')
+    assert SlottedDataclass.__doc__ == 'Docstring'
+    assert not hasattr(instance, '__dict__')
+    assert instance.optional_value is None
+    assert instance == SlottedDataclass(1, None)
+    assert copy.deepcopy(instance) == instance
+
+    with pytest.raises(AttributeError):
+        instance.unknown_attribute = 1  # type: ignore
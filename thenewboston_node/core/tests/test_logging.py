@@ -0,0 +1,35 @@
+import logging
+
+import pytest
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.core.logging import validates, validation_logger
+
+
+class Model:
+
+    def __init__(self, value):
+        self.value = value
+
+    @validates('model with value {0.value}')
+    def validate(self):
+        if self.value < 0:
+            raise ValidationError('Value must be non-negative')
+
+
+@pytest.mark.parametrize('level', (logging.DEBUG, logging.WARNING))
+def test_validates_logging(caplog, level):
+    caplog.set_level(level, logger=validation_logger.name)
+
+    Model(1).validate()
+    if level == logging.DEBUG:
+        assert [record.getMessage() for record in caplog.records
+                ] == ['Validating model with value 1', 'Model with value 1 is valid']
+    else:
+        assert not caplog.records
+
+    caplog.clear()
+    with pytest.raises(ValidationError):
+        Model(-1).validate()
+
+    assert caplog.records[-1].getMessage() == 'Model with value -1 is invalid: Value must be non-negative'
@@ -1,5 +1,32 @@
+import dataclasses
 import typing
 
 
 def is_optional(type_):
     return typing.get_origin(type_) is typing.Union and type(None) in typing.get_args(type_)
+
+
+def add_slots(cls):
+    """
+    Recreate dataclass `cls` with `__slots__` for its fields (backport of `@dataclass(slots=True)` from Python 3.10).
+
+    Methods of `cls` must not use zero-argument `super()`, since it refers to the original class.
+    """
+    inherited_slots = set()
+    for base in cls.__mro__[1:]:
+        inherited_slots.update(getattr(base, '__slots__', ()))
+
+    field_names = tuple(field.name for field in dataclasses.fields(cls) if field.name not in inherited_slots)
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for field_name in field_names:
+        # Default values are kept in generated `__init__()`, class attributes would conflict with slots
+        cls_dict.pop(field_name, None)
+
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls